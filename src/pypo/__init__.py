@@ -2,3 +2,6 @@
 
 __version__ = "0.1.0"
 __author__ = "Your Name"
+
+# Display name used in help and version output
+PROG_NAME = "Python Project (pypo)"
@@ -0,0 +1,25 @@
+"""Console entry point for Python Project (pypo)."""
+
+import sys
+
+from pypo import PROG_NAME, __version__
+
+
+def run() -> None:
+    """
+    Run the CLI.
+    
+    'pypo --version' is answered here, before Click and the command
+    group are imported, since it is the one invocation that needs
+    neither.
+    """
+    if sys.argv[1:] == ["--version"]:
+        print(f"{PROG_NAME}, version {__version__}")
+        return
+    
+    from pypo.cli import main
+    main()
+
+
+if __name__ == "__main__":
+    run()
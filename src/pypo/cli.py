@@ -1,23 +1,49 @@
 """Main CLI entry point for Python Project (pypo)."""
 
+import importlib
+
 import click
 
-from pypo import __version__
-from pypo.commands import (
-    archive,
-    create,
-    delete,
-    duplicate,
-    edit,
-    export,
-    init,
-    list_cmd,
-    source,
-)
-
-
-@click.group()
-@click.version_option(version=__version__, prog_name="Python Project (pypo)")
+from pypo import PROG_NAME, __version__
+
+# Command name -> "module:attribute". Modules are imported only when
+# Click actually needs the command, so e.g. 'pypo --version' never
+# pulls in YAML parsing or the project generator.
+COMMANDS = {
+    "create": "pypo.commands.create:create",
+    "init": "pypo.commands.init:init",
+    "list": "pypo.commands.list_cmd:list_templates",
+    "source": "pypo.commands.source:source",
+    "edit": "pypo.commands.edit:edit",
+    "export": "pypo.commands.export:export",
+    "duplicate": "pypo.commands.duplicate:duplicate",
+    "delete": "pypo.commands.delete:delete",
+    "archive": "pypo.commands.archive:archive",
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports subcommands on first use."""
+    
+    def __init__(self, *args, lazy_commands: dict[str, str], **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands
+    
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """List eager and lazy command names without importing them."""
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+    
+    def get_command(self, ctx: click.Context, cmd_name: str):
+        """Import and register a lazy command the first time it is requested."""
+        if cmd_name in self.lazy_commands and cmd_name not in self.commands:
+            module_name, attr = self.lazy_commands[cmd_name].split(":")
+            module = importlib.import_module(module_name)
+            self.add_command(getattr(module, attr), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(cls=LazyGroup, lazy_commands=COMMANDS)
+@click.version_option(version=__version__, prog_name=PROG_NAME)
 def main():
     """
     Python Project (pypo) - Scaffold projects from YAML templates.
@@ -36,17 +62,5 @@ def main():
     pass
 
 
-# Register all commands
-main.add_command(create.create)
-main.add_command(init.init)
-main.add_command(list_cmd.list_templates)
-main.add_command(source.source)
-main.add_command(edit.edit)
-main.add_command(export.export)
-main.add_command(duplicate.duplicate)
-main.add_command(delete.delete)
-main.add_command(archive.archive)
-
-
 if __name__ == "__main__":
     main()
@@ -25,15 +25,18 @@ def archive(name: str, restore: bool):
         
         pypo archive my-template --restore
     """
+    # Look up both locations once; each branch needs both answers
+    is_active, is_archived = storage.locate_template(name)
+    
     if restore:
         # Restore from archive
-        if not storage.template_exists(name, archived=True):
+        if not is_archived:
             print_error(f"Template '{name}' not found in archive.")
             print_info("Run 'pypo list --archived' to see archived templates.")
             raise SystemExit(1)
         
         # Check if active template with same name exists
-        if storage.template_exists(name, archived=False):
+        if is_active:
             print_error(f"An active template named '{name}' already exists.")
             print_info("Delete or rename the active template first.")
             raise SystemExit(1)
@@ -49,23 +52,24 @@ def archive(name: str, restore: bool):
             raise SystemExit(1)
     else:
         # Archive the template
-        if not storage.template_exists(name, archived=False):
+        if not is_active:
             print_error(f"Template '{name}' not found.")
             print_info("Run 'pypo list' to see available templates.")
             raise SystemExit(1)
         
         # Check if archived template with same name exists
-        if storage.template_exists(name, archived=True):
+        if is_archived:
             print_error(f"An archived template named '{name}' already exists.")
             print_info(
-                f"Delete the archived version first with: pypo delete {name} --archived"
+                "Delete the archived version first with: pypo delete %s --archived",
+                name,
             )
             raise SystemExit(1)
         
         try:
             if storage.archive_template(name):
                 print_success(f"Template '{name}' archived successfully!")
-                print_info("Restore with: pypo archive {name} --restore")
+                print_info("Restore with: pypo archive %s --restore", name)
             else:
                 print_error("Failed to archive template.")
                 raise SystemExit(1)
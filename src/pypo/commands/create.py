@@ -4,7 +4,7 @@ from pathlib import Path
 
 import click
 
-from pypo.core.parser import TemplateError, parse_template
+from pypo.core.parser import TemplateError, parse_template_string
 from pypo.core.storage import storage
 from pypo.utils.helpers import print_error, print_info, print_success
 
@@ -40,21 +40,25 @@ def create(name: str, path: Path, force: bool):
         raise SystemExit(1)
     
     try:
-        # Load and validate the template
-        content = path.read_text(encoding="utf-8")
-        template = parse_template(content)
+        # Read and parse once. Decoding strictly as UTF-8 rejects UTF-16/32
+        # files the loader would accept but no other command can read, and
+        # newlines are normalized as read_text() would, so the stored bytes
+        # follow the platform's convention
+        text = path.read_bytes().decode("utf-8")
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+        template = parse_template_string(text)
         
         # Get template info for display
         template_name = template.get("name", name)
         description = template.get("description", "No description")
         
         # Save the template
-        saved_path = storage.save_template(name, content)
+        saved_path = storage.save_template(name, text)
         
         print_success(f"Template '{name}' created successfully!")
-        print_info(f"  Name: {template_name}")
-        print_info(f"  Description: {description}")
-        print_info(f"  Stored at: {saved_path}")
+        print_info("  Name: %s", template_name)
+        print_info("  Description: %s", description)
+        print_info("  Stored at: %s", saved_path)
         
     except TemplateError as e:
         print_error(f"Invalid template: {e}")
@@ -14,17 +14,26 @@ from pypo.utils.helpers import print_error, print_info, print_success
     is_flag=True,
     help="Overwrite if new name already exists"
 )
-def duplicate(source_name: str, new_name: str, force: bool):
+@click.option(
+    "--copy", "-c",
+    is_flag=True,
+    help="Always write a separate copy instead of hard-linking"
+)
+def duplicate(source_name: str, new_name: str, force: bool, copy: bool):
     """
     Duplicate a template with a new name.
     
-    Creates a copy of an existing template under a different name.
+    Creates a copy of an existing template under a different name. Where
+    the filesystem can't clone files, the copy shares the original's data
+    through a hard link until either template is edited or saved.
     
     Examples:
     
         pypo duplicate my-web-project my-web-project-v2
         
         pypo duplicate react-app react-app-typescript --force
+        
+        pypo duplicate node-api node-api-v2 --copy
     """
     # Check if source template exists
     if not storage.template_exists(source_name):
@@ -33,20 +42,21 @@ def duplicate(source_name: str, new_name: str, force: bool):
         raise SystemExit(1)
     
     # Check if destination already exists
-    if storage.template_exists(new_name) and not force:
+    dest_exists = storage.template_exists(new_name)
+    if dest_exists and not force:
         print_error(f"Template '{new_name}' already exists. Use --force to overwrite.")
         raise SystemExit(1)
     
     # Delete existing if force
-    if storage.template_exists(new_name) and force:
+    if dest_exists:
         storage.delete_template(new_name)
     
     # Duplicate the template
     try:
-        if storage.duplicate_template(source_name, new_name):
+        if storage.duplicate_template(source_name, new_name, copy=copy):
             print_success("Template duplicated successfully!")
-            print_info(f"  From: {source_name}")
-            print_info(f"  To:   {new_name}")
+            print_info("  From: %s", source_name)
+            print_info("  To:   %s", new_name)
         else:
             print_error("Failed to duplicate template.")
             raise SystemExit(1)
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
+import shlex
+import shutil
 import subprocess
+from pathlib import Path
 
 import click
 
 from pypo.core.config import config
-from pypo.core.parser import TemplateError, parse_template
+from pypo.core.parser import TemplateError, parse_template_string
 from pypo.core.storage import storage
 from pypo.utils.helpers import print_error, print_info, print_success, print_warning
 
@@ -35,44 +39,50 @@ def edit(name: str, editor: str | None):
         pypo edit node-api -e vim
     """
     # Check if template exists
-    if not storage.template_exists(name):
+    exists, template_path = storage.exists_and_path(name)
+    if not exists:
         print_error(f"Template '{name}' not found.")
         print_info("Run 'pypo list' to see available templates.")
         raise SystemExit(1)
     
-    # Get template path
-    template_path = storage.get_template_path(name)
-    
     # Determine editor
     if editor is None:
         editor = config.get("editor")
     
-    # Store original content for comparison
-    original_content = template_path.read_text(encoding="utf-8")
+    # Editors may write in place; don't let that reach a linked duplicate
+    storage.unshare_template(name)
+    
+    # Remember the file's stat fingerprint; an unchanged mtime and size
+    # means the editor never wrote it, so there's nothing to re-read.
+    # A digest of the content is kept too, for editors that save without
+    # changes, so the original bytes needn't stay in memory meanwhile.
+    original_stat = _fingerprint(template_path)
+    original_digest = _content_digest(template_path.read_bytes())
     
     try:
         # Open in editor
-        print_info(f"Opening '{name}' in {editor}...")
+        print_info("Opening '%s' in %s...", name, editor)
         
-        if os.name == "nt":
-            # Windows
-            subprocess.run([editor, str(template_path)], shell=True)
-        else:
-            # Unix-like
-            subprocess.run([editor, str(template_path)])
+        # Launch the editor directly, without an intermediate shell
+        subprocess.run([*_editor_command(editor), str(template_path)])
         
         # Wait for editor to close
         print_info("Validating changes...")
         
-        # Validate the updated template
-        new_content = template_path.read_text(encoding="utf-8")
+        if _fingerprint(template_path) == original_stat:
+            print_info("No changes detected.")
+            return
         
-        if new_content == original_content:
+        # Saved but unchanged (or only trailing whitespace added): the
+        # template's meaning is the same, so skip re-parsing it
+        new_content = template_path.read_bytes()
+        if _content_digest(new_content) == original_digest:
             print_info("No changes detected.")
             return
         
+        # Validate the updated template
         try:
-            parse_template(new_content)
+            parse_template_string(new_content)
             print_success(f"Template '{name}' updated and validated successfully!")
         except TemplateError as e:
             print_warning(f"Template has validation warnings: {e}")
@@ -85,3 +95,38 @@ def edit(name: str, editor: str | None):
     except Exception as e:
         print_error(f"Failed to edit template: {e}")
         raise SystemExit(1)
+
+
+def _editor_command(editor: str) -> list[str]:
+    """
+    Split an editor setting such as 'code --wait' into an argument list.
+    
+    The program is resolved up front, which also lets Windows find
+    .cmd/.bat shims such as 'code'. A setting that names an existing
+    program as a whole is kept intact, even if its path has spaces.
+    """
+    resolved = shutil.which(editor)
+    if resolved:
+        return [resolved]
+    
+    if os.name == "nt":
+        # Non-POSIX mode keeps backslashes, but also the quotes
+        argv = [arg.strip('"') for arg in shlex.split(editor, posix=False)]
+    else:
+        argv = shlex.split(editor)
+    if not argv:
+        return [editor]
+    
+    argv[0] = shutil.which(argv[0]) or argv[0]
+    return argv
+
+
+def _fingerprint(path: Path) -> tuple[int, int]:
+    """Return a cheap (mtime_ns, size) fingerprint of a file."""
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def _content_digest(content: bytes) -> bytes:
+    """Hash file content, ignoring trailing whitespace."""
+    return hashlib.blake2b(content.rstrip(), digest_size=16).digest()
@@ -54,7 +54,7 @@ def export(name: str, output: Path, force: bool):
     try:
         if storage.export_template(name, output):
             print_success(f"Template '{name}' exported successfully!")
-            print_info(f"Saved to: {output}")
+            print_info("Saved to: %s", output)
         else:
             print_error("Failed to export template.")
             raise SystemExit(1)
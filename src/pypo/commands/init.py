@@ -1,11 +1,12 @@
 """Init command - Scaffold a project from a template."""
 
 from pathlib import Path
+from typing import Optional
 
 import click
 
 from pypo.core.generator import GeneratorError, generate_project
-from pypo.core.parser import TemplateError, parse_template
+from pypo.core.parser import TemplateError, parse_template_string
 from pypo.core.storage import storage
 from pypo.utils.helpers import console, print_error, print_info, print_success
 
@@ -23,7 +24,13 @@ from pypo.utils.helpers import console, print_error, print_info, print_success
     is_flag=True,
     help="Overwrite existing files"
 )
-def init(name: str, output: Path, force: bool):
+@click.option(
+    "--jobs", "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of files to write in parallel (default: auto)"
+)
+def init(name: str, output: Path, force: bool, jobs: Optional[int]):
     """
     Initialize a new project from a saved template.
     
@@ -36,9 +43,16 @@ def init(name: str, output: Path, force: bool):
         pypo init react-app --output ./new-project
         
         pypo init node-api -o ~/projects/my-api --force
+        
+        pypo init big-monorepo --jobs 1
     """
-    # Check if template exists
-    if not storage.template_exists(name):
+    # Check if template exists, reading it in the same lookup
+    try:
+        found = storage.open_template(name)
+    except (OSError, UnicodeDecodeError) as e:
+        print_error(f"Unexpected error: {e}")
+        raise SystemExit(1)
+    if found is None:
         print_error(f"Template '{name}' not found.")
         print_info("Run 'pypo list' to see available templates.")
         raise SystemExit(1)
@@ -52,29 +66,29 @@ def init(name: str, output: Path, force: bool):
         raise SystemExit(1)
     
     try:
-        # Load and parse template
-        content = storage.get_template(name)
-        template = parse_template(content)
+        # Parse template
+        _, content = found
+        template = parse_template_string(content)
         
         # Generate project structure
-        print_info(f"Initializing project from template '{name}'...")
+        print_info("Initializing project from template '%s'...", name)
         
-        files, dirs = generate_project(template, output)
+        files, dirs = generate_project(template, output, jobs=jobs)
         
         print_success("Project initialized successfully!")
-        console.print("\n[bold]Created:[/bold]")
-        console.print(f"  📁 {len(dirs)} directories")
-        console.print(f"  📄 {len(files)} files")
-        console.print(f"\n[bold]Location:[/bold] {output}")
+        console().print("\n[bold]Created:[/bold]")
+        console().print(f"  📁 {len(dirs)} directories")
+        console().print(f"  📄 {len(files)} files")
+        console().print(f"\n[bold]Location:[/bold] {output}")
         
         # Show created structure
         if len(files) <= 15:
-            console.print("\n[bold]Files created:[/bold]")
+            console().print("\n[bold]Files created:[/bold]")
             for f in files:
                 rel_path = f.relative_to(output)
-                console.print(f"  [dim]└─[/dim] {rel_path}")
+                console().print(f"  [dim]└─[/dim] {rel_path}")
         else:
-            console.print(f"\n[dim]Run 'tree {output}' to see full structure.[/dim]")
+            console().print(f"\n[dim]Run 'tree {output}' to see full structure.[/dim]")
         
     except TemplateError as e:
         print_error(f"Invalid template: {e}")
@@ -1,5 +1,9 @@
 """List command - Display all templates."""
 
+import functools
+import re
+from typing import Optional
+
 import click
 
 from pypo.core.storage import storage
@@ -33,7 +37,7 @@ def list_templates(archived: bool, show_all: bool):
     """
     if show_all:
         _show_templates(active=True)
-        console.print()
+        console().print()
         _show_templates(active=False)
     else:
         _show_templates(active=not archived)
@@ -41,34 +45,170 @@ def list_templates(archived: bool, show_all: bool):
 
 def _show_templates(active: bool = True):
     """Display templates in a table."""
-    templates = storage.list_templates(archived=not active)
+    templates = storage.list_templates_with_stat(archived=not active)
     label = "Active" if active else "Archived"
     
     if not templates:
-        print_info(f"No {label.lower()} templates found.")
+        print_info("No %s templates found.", label.lower())
         if active:
-            console.print("[dim]Create one: pypo create <name> --path <yaml>[/dim]")
+            console().print("[dim]Create one: pypo create <name> --path <yaml>[/dim]")
         return
     
     # Load template info for each
     template_info = []
-    for name in templates:
-        content = storage.get_template(name, archived=not active)
-        if content:
-            try:
-                import yaml
-
-                from pypo.core.parser import TemplateParser
-                data = yaml.safe_load(content)
-                info = TemplateParser.get_template_info(data)
-                template_info.append(info)
-            except Exception:
-                template_info.append({
-                    "name": name,
-                    "description": "Unable to parse",
-                    "version": "?"
-                })
+    for name, mtime_ns, size in templates:
+        if size:
+            path = storage.get_template_path(name, archived=not active)
+            template_info.append(
+                _load_template_info(name, str(path), mtime_ns, size)
+            )
     
     table = create_template_table(template_info)
     table.title = f"{label} Templates"
-    console.print(table)
+    console().print(table)
+
+
+@functools.lru_cache(maxsize=256)
+def _load_template_info(name: str, path: str, mtime_ns: int, size: int) -> dict:
+    """Parse a template file's display info, cached until the file changes."""
+    try:
+        info = _read_header_info(path, size)
+        if info is not None:
+            return info
+        
+        # Same loader as the parser (libyaml's CSafeLoader when available)
+        from pypo.core.parser import TemplateParser
+        with open(path, "rb") as f:
+            data = TemplateParser.load_from_string(f.read())
+        return TemplateParser.get_template_info(data)
+    except Exception:
+        return {
+            "name": name,
+            "description": "Unable to parse",
+            "version": "?"
+        }
+
+
+# How much of a template to scan for top-level name/description/version
+_HEADER_SIZE = 2048
+
+# A top-level 'key: value' line. YAML needs a space after the colon, and
+# PyYAML rejects tabs around plain values. Anything else at column 0
+# (document markers, directives, sequences, quoted keys) needs YAML.
+_TOP_LEVEL_RE = re.compile(rb"([A-Za-z_][\w.-]*):(?: +(.*?))? *")
+
+# Header fields shown by list
+_FIELDS = frozenset({b"name", b"description", b"version"})
+
+# First characters that make a plain YAML scalar mean something special.
+# Digits, '+' and '.' start values YAML 1.1 may read as numbers or dates.
+_SPECIAL_STARTS = frozenset(b"\"'|>[]{}&*!%@`#,?-+.0123456789")
+
+# Plain scalars YAML reads as null or a boolean rather than a string
+_NON_STRING_WORDS = frozenset(
+    word
+    for base in (b"null", b"true", b"false", b"yes", b"no", b"on", b"off")
+    for word in (base, base.capitalize(), base.upper())
+) | {b"~", b"="}
+
+# Closing character a one-line value starting with the key must end with
+_CLOSERS = {ord('"'): b'"', ord("'"): b"'", ord("["): b"]", ord("{"): b"}"}
+
+
+def _read_header_info(path: str, size: int) -> Optional[dict]:
+    """
+    Read display info from a template's top-level scalars without YAML.
+    
+    Only the first _HEADER_SIZE bytes are scanned, line by line. Returns
+    None, so the caller falls back to a full parse, whenever a scanned line
+    can't be read exactly: quoting, escapes, comments, values that continue
+    on further lines, document markers, tabs, values YAML reads as
+    non-strings, or fields beyond the scanned header.
+    
+    Indented lines and anything past the scanned header are not checked,
+    so a template that is broken further down (e.g. inside 'structure') is
+    still listed with its header info; the error is reported when the
+    template is used.
+    """
+    with open(path, "rb") as f:
+        head = f.read(_HEADER_SIZE)
+    truncated = size > len(head)
+    if truncated:
+        # Drop a partially read last line
+        head = head[:head.rfind(b"\n") + 1]
+    
+    fields = {}
+    # Whether indented lines here would continue the previous value
+    # rather than hold a nested block (or, before any key, open the document)
+    continues = True
+    for line in head.split(b"\n"):
+        if line.endswith(b"\r"):
+            line = line[:-1]
+        if not line.strip() or line[:1] == b"#":
+            continue
+        if line[:1] == b" ":
+            if continues:
+                return None
+            continue
+        
+        match = _TOP_LEVEL_RE.fullmatch(line)
+        if match is None:
+            return None
+        key, raw = match.groups()
+        raw = raw or b""
+        
+        if key in _FIELDS:
+            value = _simple_scalar(raw)
+            if value is None:
+                return None
+            fields[key.decode("ascii")] = value
+        elif raw and raw[0] in _CLOSERS and not _closed_on_line(raw):
+            # A quoted or flow value that may close on a later line
+            return None
+        
+        # Empty values and block scalars are followed by nested lines
+        continues = bool(raw) and raw[:1] not in b"#|>"
+    
+    # A field missing from a partial read may still appear further down
+    if "name" not in fields or (truncated and len(fields) < 3):
+        return None
+    
+    from pypo.core.parser import TemplateParser
+    return TemplateParser.get_template_info(fields)
+
+
+def _closed_on_line(raw: bytes) -> bool:
+    """Check that a quoted or flow value visibly ends on its own line."""
+    if len(raw) < 2 or not raw.endswith(_CLOSERS[raw[0]]):
+        return False
+    if raw[:1] == b'"':
+        # The closing quote might be escaped
+        return b"\\" not in raw
+    if raw[:1] == b"'":
+        # Quotes inside are doubled, so a closed scalar has an even count
+        return raw.count(b"'") % 2 == 0
+    return True
+
+
+def _simple_scalar(raw: bytes) -> Optional[str]:
+    """Decode a quoted or plain one-line YAML scalar, or None if not simple."""
+    if len(raw) >= 2 and raw[0] == raw[-1] and raw[:1] in (b'"', b"'"):
+        inner = raw[1:-1]
+        if raw[:1] in inner or b"\\" in inner:
+            return None
+    elif (
+        not raw
+        or raw[0] in _SPECIAL_STARTS
+        or raw in _NON_STRING_WORDS
+        or b" #" in raw
+        or b"\t" in raw
+        or b": " in raw
+    ):
+        return None
+    else:
+        inner = raw
+    
+    try:
+        return inner.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
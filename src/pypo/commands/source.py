@@ -1,5 +1,7 @@
 """Source command - Display template YAML content."""
 
+import sys
+
 import click
 
 from pypo.core.storage import storage
@@ -22,7 +24,8 @@ def source(name: str, archived: bool, raw: bool):
     """
     Display the source YAML of a template.
     
-    Shows the full YAML content with syntax highlighting.
+    Shows the full YAML content with syntax highlighting. When output is
+    piped, the raw YAML is printed instead.
     
     Examples:
     
@@ -33,16 +36,17 @@ def source(name: str, archived: bool, raw: bool):
         pypo source my-template --raw
     """
     # Check if template exists
-    if not storage.template_exists(name, archived=archived):
+    exists, template_path = storage.exists_and_path(name, archived=archived)
+    if not exists:
         location = "archive" if archived else "templates"
         print_error(f"Template '{name}' not found in {location}.")
         print_info("Run 'pypo list' to see available templates.")
         raise SystemExit(1)
     
-    # Get and display content
-    content = storage.get_template(name, archived=archived)
-    
-    if raw:
-        click.echo(content)
+    # Get and display content. Raw output is written without decoding, and
+    # piped output skips highlighting since the colors would be dropped anyway
+    if raw or not sys.stdout.isatty():
+        click.echo(template_path.read_bytes())
     else:
+        content = template_path.read_text(encoding="utf-8")
         print_yaml(content, title=f"Template: {name}")
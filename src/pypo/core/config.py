@@ -1,18 +1,20 @@
 """Configuration management for Python Project (pypo)."""
 
 import os
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Optional
 
 
 class Config:
     """Configuration manager with environment variable support."""
     
-    # Default configuration values
-    DEFAULTS = {
+    # Default configuration values (read-only; user values live in config.json)
+    DEFAULTS: Mapping[str, Any] = MappingProxyType({
         "editor": "notepad" if os.name == "nt" else "nano",
         "default_output_dir": ".",
-    }
+    })
     
     # Environment variable prefix
     ENV_PREFIX = "PYPO_"
@@ -26,6 +28,8 @@ class Config:
         """
         self._storage = storage
         self._cache: Optional[dict] = None
+        self._merged: Optional[dict] = None
+        self._env: Optional[dict[str, str]] = None
     
     @property
     def storage(self):
@@ -49,21 +53,12 @@ class Config:
             Configuration value
         """
         # Check environment variable first
-        env_key = f"{self.ENV_PREFIX}{key.upper()}"
-        env_value = os.environ.get(env_key)
+        env_value = self._get_env().get(key.upper())
         if env_value is not None:
             return env_value
         
-        # Check user config
-        user_config = self._get_user_config()
-        if key in user_config:
-            return user_config[key]
-        
-        # Check defaults
-        if key in self.DEFAULTS:
-            return self.DEFAULTS[key]
-        
-        return default
+        # Then user config merged over defaults
+        return self._get_merged().get(key, default)
     
     def set(self, key: str, value: Any) -> None:
         """
@@ -76,7 +71,7 @@ class Config:
         user_config = self._get_user_config()
         user_config[key] = value
         self.storage.save_config(user_config)
-        self._cache = user_config
+        self._set_cache(user_config)
     
     def delete(self, key: str) -> bool:
         """
@@ -92,33 +87,62 @@ class Config:
         if key in user_config:
             del user_config[key]
             self.storage.save_config(user_config)
-            self._cache = user_config
+            self._set_cache(user_config)
             return True
         return False
     
     def all(self) -> dict[str, Any]:
         """Get all configuration values (merged)."""
-        result = self.DEFAULTS.copy()
-        result.update(self._get_user_config())
-        
-        # Apply environment overrides
-        for key in result.keys():
-            env_key = f"{self.ENV_PREFIX}{key.upper()}"
-            env_value = os.environ.get(env_key)
-            if env_value is not None:
-                result[key] = env_value
-        
-        return result
+        return dict(self._get_merged())
+    
+    def _get_merged(self) -> dict:
+        """Get defaults, user config and env overrides merged (cached)."""
+        user_config = self._get_user_config()
+        if self._merged is None:
+            merged = {**self.DEFAULTS, **user_config}
+            
+            # Apply environment overrides
+            env = self._get_env()
+            for key in merged:
+                env_value = env.get(key.upper())
+                if env_value is not None:
+                    merged[key] = env_value
+            
+            self._merged = merged
+        return self._merged
+    
+    def _get_env(self) -> dict[str, str]:
+        """Get PYPO_* environment overrides, scanned once per process."""
+        if self._env is None:
+            prefix = self.ENV_PREFIX
+            self._env = {
+                name[len(prefix):]: value
+                for name, value in os.environ.items()
+                if name.startswith(prefix)
+            }
+        return self._env
     
     def _get_user_config(self) -> dict:
-        """Get user configuration (cached)."""
-        if self._cache is None:
-            self._cache = self.storage.get_config()
-        return self._cache
+        """
+        Get user configuration.
+        
+        Storage only re-parses config.json when it changes; the merged view
+        is rebuilt only when the values it returns differ from last time.
+        """
+        user_config = self.storage.get_config()
+        if user_config != self._cache:
+            self._cache = user_config
+            self._merged = None
+        return user_config
+    
+    def _set_cache(self, user_config: dict) -> None:
+        """Replace the cached user config after writing it."""
+        self._cache = dict(user_config)
+        self._merged = None
     
     def get_storage_dir(self) -> Path:
         """Get the storage directory (supports env override)."""
-        env_dir = os.environ.get(f"{self.ENV_PREFIX}STORAGE_DIR")
+        env_dir = self._get_env().get("STORAGE_DIR")
         if env_dir:
             return Path(env_dir)
         return self.storage.base_dir
@@ -2,9 +2,25 @@
 
 from __future__ import annotations
 
+import functools
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+from pypo.utils.files import encode_text, write_file
+
+# Writes release the GIL, so I/O-bound workers can outnumber CPUs.
+DEFAULT_JOBS = min(32, (os.cpu_count() or 1) * 4)
+
+# Below this many files, starting a thread pool costs more than it saves.
+_PARALLEL_MIN_FILES = 16
+
+# Small files are written with raw os.write(); larger ones go through
+# the buffered file object.
+_SMALL_FILE_SIZE = 64 * 1024
+
 
 class GeneratorError(Exception):
     """Raised when project generation fails."""
@@ -14,19 +30,41 @@ class GeneratorError(Exception):
 class ProjectGenerator:
     """Generate project folder structure from templates."""
     
-    def __init__(self, template: dict[str, Any], output_dir: Path):
+    def __init__(
+        self,
+        template: dict[str, Any],
+        output_dir: Path,
+        jobs: int | None = None
+    ):
         """
         Initialize generator.
         
         Args:
             template: Parsed template dictionary
             output_dir: Directory to generate project in
+            jobs: Number of parallel file writers (default: auto)
         """
         self.template = template
         self.output_dir = output_dir
-        self.variables = template.get("variables", {})
+        self.jobs = jobs or DEFAULT_JOBS
+        self.variables = template.get("variables") or {}
         self.created_files: list[Path] = []
         self.created_dirs: list[Path] = []
+        self._known_dirs: set[Path] = set()
+        self._pending: dict[Path, bytes] = {}
+        
+        # One alternation for all variables, longest names first so a
+        # name never shadows a longer one sharing its prefix.
+        self._var_map = {key: str(value) for key, value in self.variables.items()}
+        if self._var_map:
+            keys = sorted(map(re.escape, self._var_map), key=len, reverse=True)
+            self._var_re = re.compile(r"\{\{\s*(" + "|".join(keys) + r")\s*\}\}")
+        else:
+            self._var_re = None
+        
+        # Identical contents (empty __init__.py files, shared snippets) are
+        # substituted and encoded once per generator
+        self._render = functools.lru_cache(maxsize=1024)(self._render_content)
     
     def generate(self) -> tuple[list[Path], list[Path]]:
         """
@@ -41,58 +79,118 @@ class ProjectGenerator:
         # Create output directory
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.created_dirs.append(self.output_dir)
+        self._known_dirs.add(self.output_dir)
         
-        # Generate structure
+        # Plan the whole tree first, then do the I/O: every directory
+        # (parents before children), then every file
         structure = self.template.get("structure", [])
-        self._generate_items(structure, self.output_dir)
+        dirs, files = self._plan(structure, self.output_dir)
+        for path in dirs:
+            self._create_directory(path)
+        for path, content in files:
+            self._queue_file(path, content)
+        self._write_files()
         
         return self.created_files, self.created_dirs
     
-    def _generate_items(self, items: list[dict], parent_dir: Path) -> None:
-        """Recursively generate structure items."""
-        for item in items:
+    def _plan(
+        self, structure: list[dict], parent_dir: Path
+    ) -> tuple[list[Path], list[tuple[Path, str]]]:
+        """
+        Flatten a structure into the directories and files it describes.
+        
+        Args:
+            structure: Structure items to walk
+            parent_dir: Directory the items are relative to
+            
+        Returns:
+            Tuple of (directories, (file_path, content) pairs), both in
+            document order
+        """
+        dirs: list[Path] = []
+        files: list[tuple[Path, str]] = []
+        
+        # Explicit stack of (item, parent_dir); children are pushed in
+        # reverse so the walk stays in document order.
+        stack = [(item, parent_dir) for item in reversed(structure)]
+        while stack:
+            item, parent = stack.pop()
             name = item.get("name", "")
             item_type = item.get("type", "file")
-            item_path = parent_dir / name
+            item_path = parent / name
             
             if item_type == "directory":
-                self._create_directory(item_path)
-                # Recursively create children
+                dirs.append(item_path)
                 children = item.get("children", [])
                 if children:
-                    self._generate_items(children, item_path)
+                    stack.extend((child, item_path) for child in reversed(children))
             else:  # file
-                content = item.get("content", "")
-                content = self._substitute_variables(content)
-                self._create_file(item_path, content)
+                files.append((item_path, item.get("content", "")))
+        
+        return dirs, files
     
     def _create_directory(self, path: Path) -> None:
-        """Create a directory."""
-        path.mkdir(parents=True, exist_ok=True)
+        """Create a directory whose parent normally exists already."""
+        try:
+            path.mkdir(exist_ok=True)
+        except FileNotFoundError:
+            # Names such as 'src/pkg' need their intermediate directories too
+            path.mkdir(parents=True, exist_ok=True)
         self.created_dirs.append(path)
+        self._known_dirs.add(path)
     
-    def _create_file(self, path: Path, content: str = "") -> None:
-        """Create a file with optional content."""
-        # Ensure parent directory exists
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(content, encoding="utf-8")
+    def _queue_file(self, path: Path, content: str = "") -> None:
+        """Render a file's content and queue it for writing."""
+        # Only names containing a separator land outside a directory
+        # the plan has already created.
+        if path.parent not in self._known_dirs:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(path.parent)
+        # A repeated path keeps its first position but the last content,
+        # exactly as sequential writes would leave it.
+        self._pending[path] = self._render(content)
         self.created_files.append(path)
     
+    def _render_content(self, content: str) -> bytes:
+        """Substitute variables in file content and encode it for writing."""
+        # Most files (READMEs, licenses, lockfiles) have no placeholders
+        if self._var_re is not None and "{{" in content:
+            content = self._substitute_variables(content)
+        return encode_text(content)
+    
+    def _write_files(self) -> None:
+        """Write queued files, in parallel when there are enough of them."""
+        pending = self._pending
+        if self.jobs == 1 or len(pending) < _PARALLEL_MIN_FILES:
+            for path, data in pending.items():
+                self._create_file(path, data)
+        else:
+            workers = min(self.jobs, len(pending))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # Consume the results so the first failed write is raised here
+                list(executor.map(self._create_file, pending, pending.values()))
+        pending.clear()
+    
+    def _create_file(self, path: Path, data: bytes = b"") -> None:
+        """Write a file's already-encoded content."""
+        if len(data) > _SMALL_FILE_SIZE:
+            path.write_bytes(data)
+        else:
+            write_file(path, data)
+    
     def _substitute_variables(self, content: str) -> str:
-        """Replace {{ variable }} placeholders with values."""
-        for key, value in self.variables.items():
-            placeholder = "{{ " + key + " }}"
-            content = content.replace(placeholder, str(value))
-            # Also handle without spaces
-            placeholder_no_space = "{{" + key + "}}"
-            content = content.replace(placeholder_no_space, str(value))
-        return content
+        """Replace {{ variable }} placeholders with values in a single pass."""
+        if self._var_re is None:
+            return content
+        var_map = self._var_map
+        return self._var_re.sub(lambda match: var_map[match.group(1)], content)
 
 
 def generate_project(
     template: dict[str, Any], 
     output_dir: Path,
-    variables: dict[str, Any] | None = None
+    variables: dict[str, Any] | None = None,
+    jobs: int | None = None
 ) -> tuple[list[Path], list[Path]]:
     """
     Convenience function to generate a project.
@@ -101,6 +199,7 @@ def generate_project(
         template: Parsed template dictionary
         output_dir: Directory to generate project in
         variables: Optional variable overrides
+        jobs: Number of parallel file writers (default: auto)
         
     Returns:
         Tuple of (created_files, created_directories)
@@ -110,5 +209,5 @@ def generate_project(
         template = template.copy()
         template["variables"] = {**template.get("variables", {}), **variables}
     
-    generator = ProjectGenerator(template, output_dir)
+    generator = ProjectGenerator(template, output_dir, jobs)
     return generator.generate()
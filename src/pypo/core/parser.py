@@ -2,11 +2,26 @@
 
 from __future__ import annotations
 
+import os
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+# Allowed values for a structure item's 'type' field
+_FILE = "file"
+_DIRECTORY = "directory"
+_ITEM_TYPES = frozenset({_FILE, _DIRECTORY})
+
+# Sentinel for dict lookups where None is a meaningful (invalid) value
+_MISSING = object()
+
 
 class TemplateError(Exception):
     """Raised when a template is invalid."""
@@ -16,8 +31,8 @@ class TemplateError(Exception):
 class TemplateParser:
     """Parse and validate YAML templates."""
     
-    REQUIRED_FIELDS = ["name", "structure"]
-    OPTIONAL_FIELDS = ["description", "version", "variables"]
+    REQUIRED_FIELDS = ("name", "structure")
+    OPTIONAL_FIELDS = ("description", "version", "variables")
     
     @staticmethod
     def load_from_file(path: Path) -> dict[str, Any]:
@@ -36,19 +51,16 @@ class TemplateParser:
         if not path.exists():
             raise TemplateError(f"Template file not found: {path}")
         
-        try:
-            content = path.read_text(encoding="utf-8")
-            return TemplateParser.load_from_string(content)
-        except yaml.YAMLError as e:
-            raise TemplateError(f"Invalid YAML: {e}")
+        # Hand the raw bytes to the loader; libyaml decodes UTF-8 itself
+        return TemplateParser.load_from_string(path.read_bytes())
     
     @staticmethod
-    def load_from_string(content: str) -> dict[str, Any]:
+    def load_from_string(content: str | bytes) -> dict[str, Any]:
         """
         Load a template from a YAML string.
         
         Args:
-            content: YAML content as string
+            content: YAML content as string or UTF-8 encoded bytes
             
         Returns:
             Parsed template as dictionary
@@ -57,7 +69,7 @@ class TemplateParser:
             TemplateError: If YAML is invalid
         """
         try:
-            data = yaml.safe_load(content)
+            data = yaml.load(content, Loader=_SafeLoader)
             if not isinstance(data, dict):
                 raise TemplateError("Template must be a YAML dictionary")
             return data
@@ -75,54 +87,7 @@ class TemplateParser:
         Returns:
             List of validation errors (empty if valid)
         """
-        errors = []
-        
-        # Check required fields
-        for field in TemplateParser.REQUIRED_FIELDS:
-            if field not in template:
-                errors.append(f"Missing required field: '{field}'")
-        
-        # Validate structure if present
-        if "structure" in template:
-            if not isinstance(template["structure"], list):
-                errors.append("'structure' must be a list")
-            else:
-                for i, item in enumerate(template["structure"]):
-                    path = f"structure[{i}]"
-                    item_errors = TemplateParser._validate_structure_item(item, path)
-                    errors.extend(item_errors)
-        
-        return errors
-    
-    @staticmethod
-    def _validate_structure_item(item: dict, path: str) -> list[str]:
-        """Validate a single structure item recursively."""
-        errors = []
-        
-        if not isinstance(item, dict):
-            return [f"{path}: must be a dictionary"]
-        
-        # Check required item fields
-        if "name" not in item:
-            errors.append(f"{path}: missing 'name' field")
-        
-        if "type" not in item:
-            errors.append(f"{path}: missing 'type' field")
-        elif item["type"] not in ["file", "directory"]:
-            errors.append(f"{path}: 'type' must be 'file' or 'directory'")
-        
-        # Validate children for directories
-        if item.get("type") == "directory" and "children" in item:
-            if not isinstance(item["children"], list):
-                errors.append(f"{path}.children: must be a list")
-            else:
-                for i, child in enumerate(item["children"]):
-                    child_errors = TemplateParser._validate_structure_item(
-                        child, f"{path}.children[{i}]"
-                    )
-                    errors.extend(child_errors)
-        
-        return errors
+        return list(_iter_errors(template))
     
     @staticmethod
     def get_template_info(template: dict[str, Any]) -> dict[str, Any]:
@@ -142,12 +107,83 @@ class TemplateParser:
         }
 
 
-def parse_template(path_or_content: str | Path) -> dict[str, Any]:
+def _iter_errors(template: dict[str, Any]) -> Iterator[str]:
+    """Yield every validation error for a template, in document order."""
+    # Check required fields
+    for field in TemplateParser.REQUIRED_FIELDS:
+        if field not in template:
+            yield f"Missing required field: '{field}'"
+    
+    # Validate structure if present
+    if "structure" in template:
+        if not isinstance(template["structure"], list):
+            yield "'structure' must be a list"
+        else:
+            yield from _iter_structure_errors(template["structure"])
+
+
+def _iter_structure_errors(structure: list) -> Iterator[str]:
+    """Yield errors for every item in a template's structure tree."""
+    # Walk the tree with an explicit stack instead of recursing. Children
+    # are pushed in reverse so errors keep document order. Each entry
+    # carries an (index, parent_trail) link rather than a formatted path,
+    # so valid items never pay for string building.
+    stack = [(item, (i, None)) for i, item in enumerate(structure)]
+    stack.reverse()
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        item, trail = pop()
+        
+        if not isinstance(item, dict):
+            yield f"{_item_path(trail)}: must be a dictionary"
+            continue
+        
+        # Check required item fields
+        if "name" not in item:
+            yield f"{_item_path(trail)}: missing 'name' field"
+        
+        # Look each field up once; _MISSING tells absent keys from None
+        item_type = item.get("type", _MISSING)
+        if item_type is _MISSING:
+            yield f"{_item_path(trail)}: missing 'type' field"
+        elif not isinstance(item_type, str) or item_type not in _ITEM_TYPES:
+            yield f"{_item_path(trail)}: 'type' must be 'file' or 'directory'"
+        
+        # Queue children for directories
+        if item_type == _DIRECTORY:
+            children = item.get("children", _MISSING)
+            if children is _MISSING:
+                continue
+            if not isinstance(children, list):
+                yield f"{_item_path(trail)}.children: must be a list"
+            else:
+                for i in range(len(children) - 1, -1, -1):
+                    push((children[i], (i, trail)))
+
+
+def _item_path(trail: tuple | None) -> str:
+    """Render a validator trail as 'structure[i].children[j]...'."""
+    indices = []
+    while trail is not None:
+        index, trail = trail
+        indices.append(index)
+    indices.reverse()
+    return f"structure[{indices[0]}]" + "".join(
+        f".children[{i}]" for i in indices[1:]
+    )
+
+
+def parse_template(path_or_content: str | bytes | os.PathLike) -> dict[str, Any]:
     """
     Convenience function to parse a template.
     
+    Path objects are read from disk; str and bytes are always treated as
+    YAML content. Use parse_template_file or parse_template_string when
+    the kind of input is known.
+    
     Args:
-        path_or_content: File path or YAML content string
+        path_or_content: File path or YAML content
         
     Returns:
         Parsed and validated template
@@ -155,13 +191,45 @@ def parse_template(path_or_content: str | Path) -> dict[str, Any]:
     Raises:
         TemplateError: If template is invalid
     """
-    if isinstance(path_or_content, Path) or (
-        isinstance(path_or_content, str) and Path(path_or_content).exists()
-    ):
-        template = TemplateParser.load_from_file(Path(path_or_content))
-    else:
-        template = TemplateParser.load_from_string(path_or_content)
+    if isinstance(path_or_content, os.PathLike):
+        return parse_template_file(Path(path_or_content))
+    return parse_template_string(path_or_content)
+
+
+def parse_template_file(path: Path) -> dict[str, Any]:
+    """
+    Parse and validate a template file.
+    
+    Args:
+        path: Path to the YAML file
+        
+    Returns:
+        Parsed and validated template
+        
+    Raises:
+        TemplateError: If the file is missing or the template is invalid
+    """
+    return _validated(TemplateParser.load_from_file(path))
+
+
+def parse_template_string(content: str | bytes) -> dict[str, Any]:
+    """
+    Parse and validate a template from YAML content.
     
+    Args:
+        content: YAML content as string or UTF-8 encoded bytes
+        
+    Returns:
+        Parsed and validated template
+        
+    Raises:
+        TemplateError: If template is invalid
+    """
+    return _validated(TemplateParser.load_from_string(content))
+
+
+def _validated(template: dict[str, Any]) -> dict[str, Any]:
+    """Return the template, or raise TemplateError listing its problems."""
     errors = TemplateParser.validate(template)
     if errors:
         error_list = "\n".join(f"  - {e}" for e in errors)
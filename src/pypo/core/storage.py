@@ -1,9 +1,34 @@
 """Storage management for Python Project (pypo) templates."""
 
+import errno
+import functools
 import json
+import os
 import shutil
+import sys
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
+
+from pypo.utils.files import encode_text, write_file
+
+try:
+    import orjson
+except ImportError:  # optional speedup, installed with the 'fast' extra
+    orjson = None
+
+# Linux ioctl request to share a file's extents with another (reflink)
+_FICLONE = 0x40049409
+
+# errno values meaning "this filesystem can't clone", as opposed to a
+# one-off failure such as a missing file
+_NO_REFLINK_ERRNOS = frozenset({
+    errno.EOPNOTSUPP,
+    errno.ENOTSUP,  # distinct from EOPNOTSUPP on macOS (clonefile)
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.ENOTTY,
+    errno.ENOSYS,
+})
 
 
 class Storage:
@@ -21,6 +46,13 @@ class Storage:
         self.archive_dir = self.base_dir / "archive"
         self.config_file = self.base_dir / "config.json"
         
+        # Whether templates_dir supports copy-on-write clones; None until
+        # the first duplicate finds out
+        self._reflink_supported: Optional[bool] = None
+        
+        # Parsed config.json keyed by its (mtime_ns, size) when read
+        self._config_cache: Optional[tuple[tuple[int, int], dict]] = None
+        
         # Ensure directories exist
         self._ensure_dirs()
     
@@ -42,19 +74,52 @@ class Storage:
         """Check if a template exists."""
         return self.get_template_path(name, archived).exists()
     
-    def save_template(self, name: str, content: str) -> Path:
+    def exists_and_path(self, name: str, archived: bool = False) -> tuple[bool, Path]:
+        """
+        Resolve a template's path and check that it exists in one lookup.
+        
+        Args:
+            name: Template name
+            archived: Look in archive instead of active templates
+            
+        Returns:
+            Tuple of (exists, template_path)
+        """
+        template_path = self.get_template_path(name, archived)
+        return template_path.exists(), template_path
+    
+    def locate_template(self, name: str) -> tuple[bool, bool]:
+        """
+        Check both the active and archived locations for a template.
+        
+        Args:
+            name: Template name
+            
+        Returns:
+            Tuple of (exists_active, exists_archived)
+        """
+        return (
+            self.get_template_path(name).exists(),
+            self.get_template_path(name, archived=True).exists(),
+        )
+    
+    def save_template(self, name: str, content: Union[str, bytes]) -> Path:
         """
         Save a template YAML file.
         
         Args:
             name: Template name (without .yaml extension)
-            content: YAML content as string
+            content: YAML content as string or UTF-8 encoded bytes
             
         Returns:
             Path to the saved template
         """
         template_path = self.get_template_path(name)
-        template_path.write_text(content, encoding="utf-8")
+        if not isinstance(content, bytes):
+            content = encode_text(content)
+        _atomic_write(template_path, content)
+        # A same-size rewrite within one mtime tick would look unchanged
+        _read_cached.cache_clear()
         return template_path
     
     def get_template(self, name: str, archived: bool = False) -> Optional[str]:
@@ -68,10 +133,29 @@ class Storage:
         Returns:
             Template content as string, or None if not found
         """
+        found = self.open_template(name, archived)
+        return found[1] if found else None
+    
+    def open_template(
+        self, name: str, archived: bool = False
+    ) -> Optional[tuple[Path, str]]:
+        """
+        Get a template's path and content with a single stat.
+        
+        Args:
+            name: Template name
+            archived: Look in archive instead of active templates
+            
+        Returns:
+            Tuple of (template_path, content), or None if not found
+        """
         template_path = self.get_template_path(name, archived)
-        if template_path.exists():
-            return template_path.read_text(encoding="utf-8")
-        return None
+        try:
+            st = template_path.stat()
+            content = _read_cached(str(template_path), st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            return None
+        return template_path, content
     
     def list_templates(self, archived: bool = False) -> list[str]:
         """
@@ -84,7 +168,40 @@ class Storage:
             List of template names (without .yaml extension)
         """
         directory = self.archive_dir if archived else self.templates_dir
-        return sorted([p.stem for p in directory.glob("*.yaml")])
+        # scandir yields names without building a Path per entry
+        with os.scandir(directory) as entries:
+            names = [
+                entry.name[:-5]
+                for entry in entries
+                if entry.name.endswith(".yaml") and entry.is_file()
+            ]
+        names.sort()
+        return names
+    
+    def list_templates_with_stat(
+        self, archived: bool = False
+    ) -> list[tuple[str, int, int]]:
+        """
+        List all template names along with their modification time and size.
+        
+        Args:
+            archived: List archived templates instead of active
+            
+        Returns:
+            Sorted list of (name, mtime_ns, size) tuples
+        """
+        directory = self.archive_dir if archived else self.templates_dir
+        with os.scandir(directory) as entries:
+            result = []
+            for entry in entries:
+                if entry.name.endswith(".yaml") and entry.is_file():
+                    try:
+                        st = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    result.append((entry.name[:-5], st.st_mtime_ns, st.st_size))
+        result.sort()
+        return result
     
     def delete_template(self, name: str, archived: bool = False) -> bool:
         """
@@ -139,13 +256,20 @@ class Storage:
             return True
         return False
     
-    def duplicate_template(self, source_name: str, dest_name: str) -> bool:
+    def duplicate_template(
+        self, source_name: str, dest_name: str, copy: bool = False
+    ) -> bool:
         """
         Duplicate a template with a new name.
         
+        Without copy-on-write support, the duplicate is hard-linked to the
+        source. Saves replace the file rather than rewriting it, and edit
+        unshares a linked template first, so the two stay independent.
+        
         Args:
             source_name: Name of template to copy
             dest_name: Name for the new copy
+            copy: Never hard-link; always write a separate copy
             
         Returns:
             True if duplicated, False if source not found
@@ -153,23 +277,73 @@ class Storage:
         source = self.get_template_path(source_name)
         dest = self.get_template_path(dest_name)
         
-        if source.exists():
-            shutil.copy(str(source), str(dest))
-            return True
-        return False
+        if not source.exists():
+            return False
+        
+        # Prefer a copy-on-write clone, which shares the source's data blocks
+        # instead of rewriting them; fall back to a byte copy
+        if self._reflink_supported is not False:
+            try:
+                _cow_copy(source, dest)
+                self._reflink_supported = True
+                return True
+            except OSError as e:
+                if e.errno in _NO_REFLINK_ERRNOS:
+                    self._reflink_supported = False
+        
+        if not copy:
+            try:
+                os.link(source, dest)
+                return True
+            except OSError:
+                pass  # e.g. FAT volumes, or dest already exists
+        
+        shutil.copy(str(source), str(dest))
+        return True
+    
+    def unshare_template(self, name: str) -> bool:
+        """
+        Give a hard-linked template its own copy of the data.
+        
+        Call this before anything modifies the template file in place
+        (such as an editor), so linked duplicates aren't changed with it.
+        
+        Args:
+            name: Template name
+            
+        Returns:
+            True if the template was linked and has been unshared
+        """
+        template_path = self.get_template_path(name)
+        if template_path.stat().st_nlink <= 1:
+            return False
+        _atomic_write(template_path, template_path.read_bytes())
+        return True
     
     def get_config(self) -> dict:
-        """Get global configuration."""
-        if self.config_file.exists():
-            return json.loads(self.config_file.read_text(encoding="utf-8"))
-        return {}
+        """Get global configuration (parsed again only when the file changes)."""
+        try:
+            st = self.config_file.stat()
+        except FileNotFoundError:
+            return {}
+        key = (st.st_mtime_ns, st.st_size)
+        if self._config_cache is None or self._config_cache[0] != key:
+            data = self.config_file.read_bytes()
+            config = orjson.loads(data) if orjson is not None else json.loads(data)
+            self._config_cache = (key, config)
+        # Callers may modify the result; keep the cached dict pristine
+        return dict(self._config_cache[1])
     
     def save_config(self, config: dict) -> None:
         """Save global configuration."""
-        self.config_file.write_text(
-            json.dumps(config, indent=2), 
-            encoding="utf-8"
-        )
+        if orjson is not None:
+            options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            data = orjson.dumps(config, option=options)
+        else:
+            data = encode_text(json.dumps(config, indent=2))
+        _atomic_write(self.config_file, data)
+        st = self.config_file.stat()
+        self._config_cache = ((st.st_mtime_ns, st.st_size), dict(config))
     
     def export_template(self, name: str, output_path: Path) -> bool:
         """
@@ -184,10 +358,85 @@ class Storage:
         """
         content = self.get_template(name)
         if content:
-            output_path.write_text(content, encoding="utf-8")
+            data = encode_text(content)
+            if output_path.exists() and not output_path.is_file():
+                # Devices and pipes (e.g. /dev/stdout) can't be renamed over
+                output_path.write_bytes(data)
+            else:
+                _atomic_write(output_path, data)
             return True
         return False
 
 
+@functools.lru_cache(maxsize=256)
+def _read_cached(path: str, mtime_ns: int, size: int) -> str:
+    """
+    Read a template file's text.
+    
+    The file's mtime and size are part of the cache key, so a file is
+    read again as soon as it changes on disk.
+    """
+    return Path(path).read_text(encoding="utf-8")
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """
+    Replace a file's contents without ever leaving it half-written.
+    
+    The data is written to a temporary file next to path and renamed
+    over it, so readers see either the old or the new content. Set
+    PYPO_FSYNC=1 to also flush the data to disk before the rename.
+    
+    Symlinks are followed, so the link's target is what gets replaced,
+    and an existing file keeps its permission bits.
+    """
+    path = path.resolve()
+    tmp = path.with_name(f"{path.name}.tmp.{os.getpid()}")
+    try:
+        write_file(tmp, data, fsync=os.environ.get("PYPO_FSYNC") == "1")
+        try:
+            shutil.copymode(path, tmp)
+        except FileNotFoundError:
+            pass  # new file: keep the umask-based default
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _cow_copy(src: Path, dst: Path) -> None:
+    """
+    Clone src to dst without copying data, where the OS supports it.
+    
+    Uses the FICLONE ioctl on Linux (Btrfs, XFS, ...) and clonefile() on
+    macOS (APFS). dst must not exist yet: an existing file is never
+    truncated, and only a dst created here is removed if cloning fails.
+    
+    Raises:
+        OSError: If the platform or filesystem can't clone the file
+    """
+    if sys.platform.startswith("linux"):
+        import fcntl
+        
+        with open(src, "rb") as fsrc, open(dst, "xb") as fdst:
+            try:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            except OSError:
+                dst.unlink()
+                raise
+        return
+    
+    if sys.platform == "darwin":
+        import ctypes
+        
+        libc = ctypes.CDLL(None, use_errno=True)
+        if libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) != 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), str(dst))
+        return
+    
+    raise OSError(errno.EOPNOTSUPP, "Copy-on-write clones not supported", str(dst))
+
+
 # Global storage instance
 storage = Storage()
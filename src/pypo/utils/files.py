@@ -0,0 +1,40 @@
+"""Low-level file writing helpers for Python Project (pypo)."""
+
+import os
+from pathlib import Path
+
+# Open flags for writing a whole file from raw bytes
+_WRITE_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+)
+
+
+def encode_text(content: str) -> bytes:
+    """Encode text as UTF-8 with the newline translation write_text applies."""
+    if os.linesep != "\n":
+        content = content.replace("\n", os.linesep)
+    return content.encode("utf-8")
+
+
+def write_file(path: Path, data: bytes, fsync: bool = False) -> None:
+    """
+    Write bytes to a file with os.open/os.write, skipping file objects.
+    
+    The file is created with the same mode as open(), so the umask still
+    applies.
+    
+    Args:
+        path: File to create or truncate
+        data: Content to write
+        fsync: Flush the data to disk before closing
+    """
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        if fsync:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
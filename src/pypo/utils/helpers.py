@@ -1,42 +1,77 @@
 """Utility helpers for Python Project (pypo)."""
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.syntax import Syntax
-from rich.table import Table
+import functools
+import os
+import sys
+from typing import TYPE_CHECKING, Any
 
-# Global console instance
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Table
 
 
-def print_success(message: str) -> None:
+@functools.lru_cache(maxsize=1)
+def console() -> "Console":
+    """
+    Get the shared console, creating it on first use.
+    
+    Rich is imported here rather than at module load, so commands only
+    pay for the parts of it they actually print with.
+    """
+    from rich.console import Console
+    return Console()
+
+
+# Informational output is dropped when PYPO_QUIET=1 and stdout is not
+# a terminal (e.g. CI logs or redirected scripts)
+_QUIET = not sys.stdout.isatty() and os.environ.get("PYPO_QUIET") == "1"
+
+
+def _format(message: str, args: tuple) -> str:
+    """Apply %-style arguments to a message, if any were given."""
+    return message % args if args else message
+
+
+def print_success(message: str, *args: Any) -> None:
     """Print a success message."""
-    console.print(f"[green]✓[/green] {message}")
+    console().print(f"[green]✓[/green] {_format(message, args)}")
 
 
-def print_error(message: str) -> None:
+def print_error(message: str, *args: Any) -> None:
     """Print an error message."""
-    console.print(f"[red]✗[/red] {message}")
+    console().print(f"[red]✗[/red] {_format(message, args)}")
 
 
-def print_warning(message: str) -> None:
+def print_warning(message: str, *args: Any) -> None:
     """Print a warning message."""
-    console.print(f"[yellow]![/yellow] {message}")
+    console().print(f"[yellow]![/yellow] {_format(message, args)}")
 
 
-def print_info(message: str) -> None:
-    """Print an info message."""
-    console.print(f"[blue]ℹ[/blue] {message}")
+def print_info(message: str, *args: Any) -> None:
+    """
+    Print an info message.
+    
+    Formatting with %-style args is deferred until the message is known
+    to be shown, so quiet runs skip building the string at all.
+    """
+    if _QUIET:
+        return
+    console().print(f"[blue]ℹ[/blue] {_format(message, args)}")
 
 
 def print_yaml(content: str, title: str = "Template") -> None:
     """Print YAML content with syntax highlighting."""
+    from rich.panel import Panel
+    from rich.syntax import Syntax
+    
     syntax = Syntax(content, "yaml", theme="monokai", line_numbers=True)
-    console.print(Panel(syntax, title=title, border_style="blue"))
+    console().print(Panel(syntax, title=title, border_style="blue"))
 
 
-def create_template_table(templates: list[dict]) -> Table:
+def create_template_table(templates: list[dict]) -> "Table":
     """Create a rich table for displaying templates."""
+    from rich.table import Table
+    
     table = Table(title="Templates", show_header=True, header_style="bold cyan")
     table.add_column("Name", style="green")
     table.add_column("Description", style="dim")
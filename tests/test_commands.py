@@ -1,5 +1,7 @@
 """Tests for Python Project (pypo) CLI commands."""
 
+import os
+
 import pytest
 from pathlib import Path
 from click.testing import CliRunner
@@ -45,6 +47,29 @@ structure:
     return template_path
 
 
+class TestCLI:
+    """Tests for the top-level command group."""
+    
+    def test_help_lists_all_commands(self, runner):
+        """Test that lazily registered commands appear in --help."""
+        from pypo.cli import COMMANDS
+        
+        result = runner.invoke(main, ["--help"])
+        assert result.exit_code == 0
+        for name in COMMANDS:
+            assert name in result.output
+    
+    def test_version_fast_path_matches_click(self, runner, monkeypatch, capsys):
+        """Test the Click-free --version output matches Click's."""
+        from pypo.__main__ import run
+        
+        monkeypatch.setattr("sys.argv", ["pypo", "--version"])
+        run()
+        
+        result = runner.invoke(main, ["--version"])
+        assert capsys.readouterr().out == result.output
+
+
 class TestListCommand:
     """Tests for the list command."""
     
@@ -52,6 +77,131 @@ class TestListCommand:
         """Test listing when no templates exist."""
         result = runner.invoke(main, ["list"])
         assert result.exit_code == 0
+    
+    def test_list_shows_template_info(self, runner, temp_storage, monkeypatch):
+        """Test that listed templates show their name and description."""
+        import pypo.commands.list_cmd as list_module
+        
+        monkeypatch.setattr(list_module, "storage", temp_storage)
+        temp_storage.save_template(
+            "web", 'name: "web-project"\ndescription: "Static site"\nstructure: []'
+        )
+        temp_storage.save_template("broken", "name: [unclosed")
+        
+        result = runner.invoke(main, ["list"])
+        assert result.exit_code == 0
+        assert "web-project" in result.output
+        assert "Static site" in result.output
+        assert "Unable to parse" in result.output
+    
+    def test_header_info_without_yaml(self, tmp_path):
+        """Test that simple top-level fields are read from the header."""
+        from pypo.commands.list_cmd import _read_header_info
+        
+        path = tmp_path / "t.yaml"
+        path.write_bytes(
+            b'name: "web"\ndescription: A site\nversion: \'2.0\'\nstructure: []\n'
+        )
+        info = _read_header_info(str(path), path.stat().st_size)
+        assert info == {"name": "web", "description": "A site", "version": "2.0"}
+    
+    def test_header_info_defers_to_yaml(self, tmp_path):
+        """Test that ambiguous or incomplete headers fall back to YAML."""
+        from pypo.commands.list_cmd import _read_header_info
+        
+        late_description = (
+            b"name: x\nstructure:\n"
+            + b"  - name: f\n    type: file\n" * 200
+            + b"description: late\n"
+        )
+        for content in (
+            b"name: web # comment\nstructure: []\n",
+            b"name: x\ndescription: long\n  continued\n",
+            b"name: ~\ndescription: d\nversion: v\n",
+            b"name: null\ndescription: d\nversion: v\n",
+            b"name: yes\ndescription: d\nversion: v\n",
+            b"name: web\t# comment\ndescription: d\n",
+            b"name: web\tsite\ndescription: d\nversion: v\n",
+            b"name:web\ndescription: d\nversion: v\n",
+            b"name: 2001-01-01\ndescription: d\nversion: v\n",
+            b"name: 0x1F\ndescription: d\nversion: v\n",
+            b"name: 1_000\ndescription: d\nversion: v\n",
+            b"name: .inf\ndescription: d\nversion: v\n",
+            b"name: web\ndescription: 12:30\nversion: v\n",
+            b"name: web\ndescription: d\nversion: 1\n",
+            b"---\nname: a\n---\nname: web\ndescription: d\nversion: v\n",
+            b"name: web\ndescription: d\nversion: v\n...\n",
+            b'name: web\ndescription: d\nnotes: "x\nversion: 3"\n',
+            b"name: web\ndescription: a\n\n  continued\nversion: v\n",
+            b"  name: web\ndescription: d\nversion: v\n",
+            late_description,
+        ):
+            path = tmp_path / "t.yaml"
+            path.write_bytes(content)
+            assert _read_header_info(str(path), len(content)) is None
+    
+    def test_header_info_ignores_errors_below_header(self, tmp_path):
+        """Test that nested content is deliberately not checked by the scan."""
+        from pypo.commands.list_cmd import _read_header_info
+        
+        path = tmp_path / "t.yaml"
+        content = (
+            b"name: web\ndescription: d\nversion: '1'\n"
+            b"structure:\n  - name: f\n   type: file\n"
+        )
+        path.write_bytes(content)
+        
+        # A full parse rejects this file; list still shows its header
+        info = _read_header_info(str(path), len(content))
+        assert info == {"name": "web", "description": "d", "version": "1"}
+
+
+class TestCreateCommand:
+    """Tests for the create command."""
+    
+    def test_create_rejects_non_utf8(self, runner, temp_storage, monkeypatch, tmp_path):
+        """Test that a template the loader accepts but isn't UTF-8 is refused."""
+        import pypo.commands.create as create_module
+        
+        monkeypatch.setattr(create_module, "storage", temp_storage)
+        path = tmp_path / "utf16.yaml"
+        path.write_bytes("name: x\nstructure: []".encode("utf-16"))
+        
+        result = runner.invoke(main, ["create", "utf16", "--path", str(path)])
+        assert result.exit_code == 1
+        assert "Failed to create template" in result.output
+        assert not temp_storage.template_exists("utf16")
+    
+    def test_create_normalizes_newlines(
+        self, runner, temp_storage, monkeypatch, tmp_path
+    ):
+        """Test that a CRLF source is stored with the platform's newlines."""
+        import pypo.commands.create as create_module
+        
+        monkeypatch.setattr(create_module, "storage", temp_storage)
+        path = tmp_path / "crlf.yaml"
+        path.write_bytes(b"name: x\r\nstructure: []\r\n")
+        
+        result = runner.invoke(main, ["create", "crlf", "--path", str(path)])
+        assert result.exit_code == 0
+        stored = temp_storage.get_template_path("crlf").read_bytes()
+        assert stored == f"name: x{os.linesep}structure: []{os.linesep}".encode()
+
+
+class TestInitCommand:
+    """Tests for the init command."""
+    
+    def test_init_undecodable_template(self, runner, temp_storage, monkeypatch):
+        """Test that a template that can't be decoded is reported, not raised."""
+        import pypo.commands.init as init_module
+        
+        monkeypatch.setattr(init_module, "storage", temp_storage)
+        temp_storage.save_template("utf16", "name: x\nstructure: []".encode("utf-16"))
+        
+        result = runner.invoke(main, ["init", "utf16", "-o", "out"])
+        assert result.exit_code == 1
+        assert "Unexpected error" in result.output
+        assert not isinstance(result.exception, UnicodeDecodeError)
 
 
 class TestSourceCommand:
@@ -62,6 +212,67 @@ class TestSourceCommand:
         result = runner.invoke(main, ["source", "nonexistent"])
         assert result.exit_code == 1
         assert "not found" in result.output.lower()
+    
+    def test_source_piped_prints_raw_yaml(self, runner, temp_storage, monkeypatch):
+        """Test that non-terminal output skips the highlighted panel."""
+        import pypo.commands.source as source_module
+        
+        monkeypatch.setattr(source_module, "storage", temp_storage)
+        temp_storage.save_template("proj", b"name: proj\nstructure: []\n")
+        
+        result = runner.invoke(main, ["source", "proj"])
+        assert result.exit_code == 0
+        assert result.output == "name: proj\nstructure: []\n\n"
+
+
+@pytest.mark.skipif(os.name == "nt", reason="uses POSIX 'true'/'touch' as editors")
+class TestEditCommand:
+    """Tests for the edit command."""
+    
+    @pytest.fixture
+    def edit_storage(self, temp_storage, monkeypatch):
+        """Point the edit command at a temporary storage."""
+        import pypo.commands.edit as edit_module
+        
+        monkeypatch.setattr(edit_module, "storage", temp_storage)
+        temp_storage.save_template("proj", "name: proj\nstructure: []\n")
+        return temp_storage
+    
+    def test_edit_without_changes(self, runner, edit_storage):
+        """Test that an editor that doesn't write is detected."""
+        result = runner.invoke(main, ["edit", "proj", "--editor", "true"])
+        assert result.exit_code == 0
+        assert "No changes detected" in result.output
+    
+    def test_edit_saved_without_changes(self, runner, edit_storage):
+        """Test that re-saving identical content skips validation."""
+        path = edit_storage.get_template_path("proj")
+        os.utime(path, ns=(0, 0))
+        
+        result = runner.invoke(main, ["edit", "proj", "--editor", "touch"])
+        assert result.exit_code == 0
+        assert "No changes detected" in result.output
+    
+    def test_edit_with_changes_validates(self, runner, edit_storage, tmp_path):
+        """Test that a modified template is re-validated."""
+        editor = tmp_path / "append-comment"
+        editor.write_text('#!/bin/sh\necho "# edited" >> "$1"\n')
+        editor.chmod(0o755)
+        
+        result = runner.invoke(main, ["edit", "proj", "--editor", str(editor)])
+        assert result.exit_code == 0
+        assert "validated successfully" in result.output
+    
+    def test_edit_editor_with_arguments(self, runner, edit_storage):
+        """Test that an editor setting with arguments is split, not run whole."""
+        from pypo.commands.edit import _editor_command
+        
+        assert _editor_command("no-such-editor --wait") == ["no-such-editor", "--wait"]
+        
+        editor = """sh -c 'echo "# edited" >> "$1"' sh"""
+        result = runner.invoke(main, ["edit", "proj", "--editor", editor])
+        assert result.exit_code == 0
+        assert "validated successfully" in result.output
 
 
 class TestParser:
@@ -75,6 +286,20 @@ class TestParser:
         assert template["name"] == "test-project"
         assert "structure" in template
     
+    def test_parse_bytes_content(self, sample_template):
+        """Test parsing raw UTF-8 bytes."""
+        from pypo.core.parser import parse_template
+        
+        template = parse_template(sample_template.read_bytes())
+        assert template["name"] == "test-project"
+    
+    def test_parse_string_is_never_treated_as_path(self, sample_template):
+        """Test that a str argument is parsed as YAML, not probed on disk."""
+        from pypo.core.parser import TemplateError, parse_template
+        
+        with pytest.raises(TemplateError, match="YAML dictionary"):
+            parse_template(str(sample_template))
+    
     def test_parse_invalid_yaml(self):
         """Test parsing invalid YAML."""
         from pypo.core.parser import parse_template, TemplateError
@@ -90,6 +315,30 @@ class TestParser:
         assert len(errors) >= 2
         assert any("name" in e for e in errors)
         assert any("structure" in e for e in errors)
+    
+    def test_validate_nested_errors_in_order(self):
+        """Test nested validation reports errors in document order."""
+        from pypo.core.parser import TemplateParser
+        
+        leaf = {"name": "leaf.txt", "type": "file"}
+        for depth in range(2000):
+            leaf = {"name": f"d{depth}", "type": "directory", "children": [leaf]}
+        
+        template = {
+            "name": "t",
+            "structure": [
+                {"name": "a", "type": "directory", "children": [{"type": "file"}]},
+                {"name": "b", "type": ["not", "hashable"]},
+                "oops",
+                leaf,
+            ],
+        }
+        
+        assert TemplateParser.validate(template) == [
+            "structure[0].children[0]: missing 'name' field",
+            "structure[1]: 'type' must be 'file' or 'directory'",
+            "structure[2]: must be a dictionary",
+        ]
 
 
 class TestStorage:
@@ -109,6 +358,59 @@ class TestStorage:
         retrieved = temp_storage.get_template("test")
         assert retrieved == content
     
+    def test_open_template(self, temp_storage):
+        """Test getting a template's path and content together."""
+        path = temp_storage.save_template("opened", b"name: o\nstructure: []")
+        
+        assert temp_storage.open_template("opened") == (path, "name: o\nstructure: []")
+        assert temp_storage.open_template("opened", archived=True) is None
+        assert temp_storage.open_template("missing") is None
+    
+    def test_get_template_sees_rewrites(self, temp_storage):
+        """Test that cached reads pick up a same-size rewrite."""
+        temp_storage.save_template("t", "name: aaaa\nstructure: []")
+        assert temp_storage.get_template("t") == "name: aaaa\nstructure: []"
+        
+        temp_storage.save_template("t", "name: bbbb\nstructure: []")
+        assert temp_storage.get_template("t") == "name: bbbb\nstructure: []"
+    
+    def test_save_template_bytes(self, temp_storage):
+        """Test saving a template from raw bytes."""
+        temp_storage.save_template("raw", b"name: raw\nstructure: []")
+        assert temp_storage.get_template("raw") == "name: raw\nstructure: []"
+    
+    def test_save_template_is_atomic(self, temp_storage, monkeypatch):
+        """Test a failed save leaves the old content and no temp file."""
+        import pypo.core.storage as storage_module
+        
+        temp_storage.save_template("atomic", b"name: old\nstructure: []")
+        
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+        
+        monkeypatch.setattr(storage_module.os, "replace", fail_replace)
+        with pytest.raises(OSError):
+            temp_storage.save_template("atomic", b"name: new\nstructure: []")
+        
+        assert temp_storage.get_template("atomic") == "name: old\nstructure: []"
+        assert [p.name for p in temp_storage.templates_dir.iterdir()] == ["atomic.yaml"]
+    
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX symlinks and modes")
+    def test_save_keeps_symlinks_and_mode(self, temp_storage, tmp_path):
+        """Test saving writes through symlinks and keeps permission bits."""
+        target = tmp_path / "dotfiles" / "config.json"
+        target.parent.mkdir()
+        target.write_text("{}")
+        target.chmod(0o600)
+        temp_storage.config_file.unlink()
+        temp_storage.config_file.symlink_to(target)
+        
+        temp_storage.save_config({"editor": "vim"})
+        
+        assert temp_storage.config_file.is_symlink()
+        assert temp_storage.get_config() == {"editor": "vim"}
+        assert target.stat().st_mode & 0o777 == 0o600
+    
     def test_list_templates(self, temp_storage):
         """Test listing templates."""
         temp_storage.save_template("template1", "name: t1\nstructure: []")
@@ -118,6 +420,16 @@ class TestStorage:
         assert "template1" in templates
         assert "template2" in templates
     
+    def test_list_templates_with_stat(self, temp_storage):
+        """Test listing templates with their mtime and size."""
+        temp_storage.save_template("b", b"name: b\nstructure: []")
+        temp_storage.save_template("a", b"name: a\nstructure: []\n")
+        (temp_storage.templates_dir / "notes.txt").write_text("ignored")
+        
+        listed = temp_storage.list_templates_with_stat()
+        assert [(name, size) for name, _, size in listed] == [("a", 22), ("b", 21)]
+        assert temp_storage.list_templates() == ["a", "b"]
+    
     def test_delete_template(self, temp_storage):
         """Test deleting a template."""
         temp_storage.save_template("to_delete", "name: d\nstructure: []")
@@ -134,6 +446,42 @@ class TestStorage:
         assert not temp_storage.template_exists("to_archive", archived=False)
         assert temp_storage.template_exists("to_archive", archived=True)
     
+    def test_get_config_cached_until_changed(self, temp_storage):
+        """Test config reads are cached and refreshed when the file changes."""
+        temp_storage.save_config({"editor": "vim"})
+        config = temp_storage.get_config()
+        config["editor"] = "emacs"
+        assert temp_storage.get_config() == {"editor": "vim"}
+        
+        temp_storage.config_file.write_text('{"editor": "code --wait"}')
+        assert temp_storage.get_config() == {"editor": "code --wait"}
+    
+    def test_config_round_trip_without_orjson(self, temp_storage, monkeypatch):
+        """Test the stdlib json fallback reads what either backend wrote."""
+        import pypo.core.storage as storage_module
+        
+        settings = {"editor": "vim", "author": "Zoë"}
+        temp_storage.save_config(settings)
+        
+        monkeypatch.setattr(storage_module, "orjson", None)
+        temp_storage._config_cache = None
+        assert temp_storage.get_config() == settings
+        
+        temp_storage.save_config({**settings, "editor": "nano"})
+        temp_storage._config_cache = None
+        assert temp_storage.get_config()["editor"] == "nano"
+    
+    def test_locate_template(self, temp_storage):
+        """Test locating a template across active and archived storage."""
+        assert temp_storage.locate_template("both") == (False, False)
+        
+        temp_storage.save_template("both", "name: b\nstructure: []")
+        temp_storage.archive_template("both")
+        assert temp_storage.locate_template("both") == (False, True)
+        
+        temp_storage.save_template("both", "name: b\nstructure: []")
+        assert temp_storage.locate_template("both") == (True, True)
+    
     def test_duplicate_template(self, temp_storage):
         """Test duplicating a template."""
         original_content = "name: original\nstructure: []"
@@ -142,6 +490,103 @@ class TestStorage:
         
         assert temp_storage.template_exists("copy")
         assert temp_storage.get_template("copy") == original_content
+    
+    def test_duplicate_onto_existing_or_same_file(self, temp_storage):
+        """Test duplicating never empties an existing or linked destination."""
+        import shutil
+        
+        content = "name: a\nstructure: []"
+        temp_storage.save_template("a", content)
+        source = temp_storage.get_template_path("a")
+        os.link(source, temp_storage.get_template_path("b"))
+        
+        for dest in ("a", "b"):
+            with pytest.raises(shutil.SameFileError):
+                temp_storage.duplicate_template("a", dest)
+            assert temp_storage.get_template("a") == content
+            assert temp_storage.get_template(dest) == content
+        
+        temp_storage.save_template("c", "name: c\nstructure: []")
+        assert temp_storage.duplicate_template("a", "c")
+        assert temp_storage.get_template("c") == content
+    
+    def test_duplicate_hardlink_stays_independent(self, temp_storage):
+        """Test hard-linked duplicates are split on save and unshare."""
+        temp_storage._reflink_supported = False
+        temp_storage.save_template("original", b"name: original\nstructure: []")
+        source = temp_storage.get_template_path("original")
+        
+        temp_storage.duplicate_template("original", "linked")
+        linked = temp_storage.get_template_path("linked")
+        assert linked.samefile(source)
+        
+        temp_storage.save_template("linked", b"name: linked\nstructure: []")
+        assert not linked.samefile(source)
+        assert temp_storage.get_template("original") == "name: original\nstructure: []"
+        
+        temp_storage.duplicate_template("original", "again")
+        assert temp_storage.unshare_template("again")
+        assert not temp_storage.unshare_template("again")
+        assert not temp_storage.get_template_path("again").samefile(source)
+        
+        temp_storage.duplicate_template("original", "copied", copy=True)
+        assert not temp_storage.get_template_path("copied").samefile(source)
+
+
+class TestConfig:
+    """Tests for the configuration manager."""
+    
+    def test_get_precedence(self, temp_storage, monkeypatch):
+        """Test env overrides user config, which overrides defaults."""
+        from pypo.core.config import Config
+        
+        monkeypatch.setenv("PYPO_EDITOR", "vim")
+        cfg = Config(storage=temp_storage)
+        cfg.set("default_output_dir", "/tmp/out")
+        
+        assert cfg.get("editor") == "vim"
+        assert cfg.get("default_output_dir") == "/tmp/out"
+        assert cfg.get("missing", "fallback") == "fallback"
+        assert cfg.all()["editor"] == "vim"
+    
+    def test_picks_up_external_config_changes(self, temp_storage):
+        """Test the cached config is reloaded when the file changes."""
+        from pypo.core.config import Config
+        
+        cfg = Config(storage=temp_storage)
+        assert cfg.get("theme") is None
+        
+        temp_storage.config_file.write_text('{"theme": "dark"}', encoding="utf-8")
+        os.utime(temp_storage.config_file, ns=(1, 1))
+        assert cfg.get("theme") == "dark"
+        
+        # Same mtime, different size: still noticed
+        temp_storage.config_file.write_text('{"theme": "light!"}', encoding="utf-8")
+        os.utime(temp_storage.config_file, ns=(1, 1))
+        assert cfg.get("theme") == "light!"
+
+
+class TestHelpers:
+    """Tests for the output helpers."""
+    
+    def test_print_info_formats_args(self, monkeypatch, capsys):
+        """Test that %-style args are applied to info messages."""
+        from pypo.utils import helpers
+        
+        monkeypatch.setattr(helpers, "_QUIET", False)
+        helpers.print_info("Stored at: %s", "/tmp/x")
+        assert "Stored at: /tmp/x" in capsys.readouterr().out
+    
+    def test_print_info_quiet(self, monkeypatch, capsys):
+        """Test that quiet mode drops info messages but not errors."""
+        from pypo.utils import helpers
+        
+        monkeypatch.setattr(helpers, "_QUIET", True)
+        helpers.print_info("hidden %s", "value")
+        helpers.print_error("shown")
+        out = capsys.readouterr().out
+        assert "hidden" not in out
+        assert "shown" in out
 
 
 class TestGenerator:
@@ -195,3 +640,105 @@ class TestGenerator:
         
         assert (output_dir / "src" / "main.py").is_file()
         assert (output_dir / "src" / "lib" / "utils.py").is_file()
+    
+    def test_generate_keeps_document_order(self, tmp_path):
+        """Test files and directories are created in template order."""
+        from pypo.core.generator import generate_project
+        
+        template = {
+            "name": "test",
+            "structure": [
+                {
+                    "name": "src",
+                    "type": "directory",
+                    "children": [
+                        {"name": "lib", "type": "directory", "children": [
+                            {"name": "utils.py", "type": "file"},
+                        ]},
+                        {"name": "main.py", "type": "file"},
+                    ]
+                },
+                {"name": "docs/index.md", "type": "file"},
+                {"name": "tests/unit", "type": "directory"},
+                {"name": "README.md", "type": "file"},
+            ]
+        }
+        
+        output_dir = tmp_path / "output"
+        files, dirs = generate_project(template, output_dir)
+        
+        assert [f.relative_to(output_dir).as_posix() for f in files] == [
+            "src/lib/utils.py", "src/main.py", "docs/index.md", "README.md",
+        ]
+        assert dirs == [
+            output_dir,
+            output_dir / "src",
+            output_dir / "src" / "lib",
+            output_dir / "tests" / "unit",
+        ]
+        assert (output_dir / "tests" / "unit").is_dir()
+    
+    def test_generate_parallel_writes(self, tmp_path):
+        """Test parallel writes produce the same files as sequential ones."""
+        from pypo.core.generator import generate_project
+        
+        structure = [
+            {"name": f"module_{i}.py", "type": "file", "content": f"# {i}\n"}
+            for i in range(40)
+        ]
+        structure.append({"name": "module_0.py", "type": "file", "content": "last"})
+        template = {"name": "test", "structure": structure}
+        
+        for jobs in (1, 4):
+            output_dir = tmp_path / f"jobs_{jobs}"
+            files, _ = generate_project(template, output_dir, jobs=jobs)
+            
+            assert len(files) == 41
+            assert files[0] == output_dir / "module_0.py"
+            assert (output_dir / "module_0.py").read_text() == "last"
+            assert (output_dir / "module_39.py").read_text() == "# 39\n"
+    
+    def test_generate_small_and_large_files(self, tmp_path):
+        """Test both file write paths, including overwriting longer files."""
+        from pypo.core.generator import generate_project
+        
+        large = "x" * (64 * 1024 + 1)
+        output_dir = tmp_path / "output"
+        output_dir.mkdir()
+        (output_dir / "small.txt").write_text("stale content that is longer")
+        
+        template = {
+            "name": "test",
+            "structure": [
+                {"name": "empty.txt", "type": "file"},
+                {"name": "small.txt", "type": "file", "content": "new"},
+                {"name": "large.txt", "type": "file", "content": large},
+            ]
+        }
+        generate_project(template, output_dir)
+        
+        assert (output_dir / "empty.txt").read_bytes() == b""
+        assert (output_dir / "small.txt").read_text() == "new"
+        assert (output_dir / "large.txt").read_text() == large
+    
+    def test_generate_substitutes_variables(self, tmp_path):
+        """Test placeholder substitution with and without spaces."""
+        from pypo.core.generator import generate_project
+        
+        template = {
+            "name": "test",
+            "variables": {"name": "demo", "name_upper": "DEMO"},
+            "structure": [
+                {
+                    "name": "README.md",
+                    "type": "file",
+                    "content": "{{ name }}/{{name_upper}}/{{  name  }}/{{ other }}",
+                },
+            ]
+        }
+        
+        output_dir = tmp_path / "output"
+        generate_project(template, output_dir, {"name": "app"})
+        
+        content = (output_dir / "README.md").read_text()
+        assert content == "app/DEMO/app/{{ other }}"